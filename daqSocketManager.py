@@ -4,9 +4,49 @@ import threading
 import struct
 import ctypes
 
+import numpy as np
+
 thread = None
 debug = True
 
+# pre-compiled length-prefix layout, shared by all messages
+_HDR = struct.Struct('<I')
+
+# Unix domain socket path used instead of TCP for loopback hosts
+# on platforms that expose AF_UNIX. Must match server.py
+UNIX_SOCKET_PATH = '/tmp/daq.sock'
+
+
+def _recv_exact(sock, count, buf=None):
+    """
+    Receives exactly count bytes from the socket. TCP is a stream,
+    so a single recv may return fewer bytes than requested; loop
+    with recv_into until the buffer is filled.
+    sock: (socket)
+    count: (int) number of bytes expected
+    buf: optional reusable bytearray; a new one is allocated when
+    none is passed or the pooled one is too small
+    """
+    if buf is None or len(buf) < count:
+        buf = bytearray(count)
+    view = memoryview(buf)
+    offset = 0
+    while offset < count:
+        received = sock.recv_into(view[offset:count])
+        if received == 0:
+            raise ConnectionResetError
+        offset += received
+    return buf
+
+
+# per-type message body parsers; 'int' carries its value in the
+# length prefix and never reads a body
+_PARSERS = {
+    'list': lambda body: json.loads(bytes(body).decode('utf-8')),
+    'str': lambda body: bytes(body),
+    'ints': lambda body: list(body),
+}
+
 
 class DaqSocketManager:
     """
@@ -27,6 +67,8 @@ class DaqSocketManager:
         self.stop_event = threading.Event()
         self.data_list = []
         self.new_data = False
+        self._recv_buf = None  # pooled receive buffer, reused per frame
+        self._scratch = bytearray(64)  # scratch for small command replies
         self.rate = 1000
         self.samples_to_display = 1000
         self.channels = [0, 1, 2, 3]
@@ -42,10 +84,10 @@ class DaqSocketManager:
 
     def get_data_list(self):
         """
-        returns the list of available USB devices
-        found on the system. It sets the new data flag
-        false to ensure repeated data won't happen
-        :return:
+        returns the most recent block of samples received
+        from the server as a numpy array. It sets the new
+        data flag false to ensure repeated data won't happen
+        :return: (numpy.ndarray)
         """
         self.new_data = False
         return self.data_list
@@ -122,54 +164,48 @@ class DaqSocketManager:
         """
         return self.gains
 
-    def send_msg(self, itm):
+    def send_msg(self, itm, typ=None):
         """
-        Send message: sends length of message then message
+        Send message: sends length of message then message. The length
+        prefix and payload are coalesced into a single sendall so each
+        message costs one syscall instead of two
         conn (socket)
         ite: can be str, int or list
+        typ: pass 'ints' to send a list of small ints packed one byte
+        each instead of as JSON
         """
         retErr = 0
-        if type(itm) is str and itm is not None:
-            packed_data = struct.pack('<' + 'I', len(itm))
-            self.socket.sendall(packed_data)
-            self.socket.sendall(itm.encode('utf-8'))
+        if typ == 'ints' and itm is not None:
+            body = bytes(itm)
+            self.socket.sendall(_HDR.pack(len(body)) + body)
+        elif type(itm) is str and itm is not None:
+            body = itm.encode('utf-8')
+            self.socket.sendall(_HDR.pack(len(body)) + body)
         elif type(itm) is int and itm is not None:
-            packed_data = struct.pack('<' + 'I', itm)
-            self.socket.sendall(packed_data)
+            self.socket.sendall(_HDR.pack(itm))
         elif type(itm) is list and itm is not None:
-            json_string = json.dumps(itm)
-            packed_data = struct.pack('<' + 'I', len(json_string))
-            self.socket.sendall(packed_data)
-            self.socket.sendall(json_string.encode('utf-8'))
+            body = json.dumps(itm).encode('utf-8')
+            self.socket.sendall(_HDR.pack(len(body)) + body)
         else:
             retErr = -1
         return retErr
 
     def get_msg(self, typ):
         """
-        receive message: gets message length then message
+        receive message: gets message length then message. Small
+        reads share one scratch bytearray instead of allocating
+        per message
         """
         # receive message length
-        recv_str = self.socket.recv(ctypes.sizeof(ctypes.c_uint))
-        unpacked_tuple = struct.unpack('<' + 'I', recv_str)
-        msg = list(unpacked_tuple)
-        retErr = 0
-        match typ:
-            case 'int':
-                item = msg[0]
-                return item
-            case 'list':
-                bytes_to_recv = msg[0]
-                s = self.socket.recv(bytes_to_recv)
-                item = json.loads(s.decode('utf-8'))
-                return item
-            case 'str':
-                bytes_to_recv = msg[0]
-                s = self.socket.recv(bytes_to_recv)
-                return s
-            case _:
-                retErr = -1
-        return retErr
+        self._scratch = _recv_exact(self.socket, _HDR.size, self._scratch)
+        length = _HDR.unpack_from(self._scratch)[0]
+        if typ == 'int':
+            return length
+        parser = _PARSERS.get(typ)
+        if parser is None:
+            return -1
+        self._scratch = _recv_exact(self.socket, length, self._scratch)
+        return parser(memoryview(self._scratch)[:length])
 
     def disconnect(self):
         self.send_msg('exit')
@@ -188,12 +224,27 @@ class DaqSocketManager:
             self.host = host
             self.port = port
             try:
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                if self.socket is None:
-                    print('Whoops no socket')
-                    return False
-                self.socket.connect((self.host, self.port))
+                # a loopback host is reached over a Unix domain socket
+                # where the platform has one, skipping the TCP/IP
+                # stack; Windows builds fall back to TCP
+                if hasattr(socket, 'AF_UNIX') and host in ('127.0.0.1',
+                                                           'localhost'):
+                    self.socket = socket.socket(socket.AF_UNIX,
+                                                socket.SOCK_STREAM)
+                    self.socket.connect(UNIX_SOCKET_PATH)
+                else:
+                    self.socket = socket.socket(socket.AF_INET,
+                                                socket.SOCK_STREAM)
+                    self.socket.connect((self.host, self.port))
                 self.socket.settimeout(2.0)
+                # match the server: no Nagle delay on the small
+                # command messages (TCP only), and a receive buffer
+                # large enough for the bursty half-second data blocks
+                if self.socket.family == socket.AF_INET:
+                    self.socket.setsockopt(socket.IPPROTO_TCP,
+                                           socket.TCP_NODELAY, 1)
+                self.socket.setsockopt(socket.SOL_SOCKET,
+                                       socket.SO_RCVBUF, 2 * 1024 * 1024)
                 print(f"Connected to {self.host}:{self.port}")
                 return True
 
@@ -203,7 +254,7 @@ class DaqSocketManager:
                 print(f'Remote server in use.')
                 self.socket = None
                 exit(0)
-            except ConnectionRefusedError:
+            except (ConnectionRefusedError, FileNotFoundError):
                 print(f"Error connecting to server at {self.host}:{self.port}")
                 print("Please ensure server program is running.")
                 self.socket = None
@@ -269,9 +320,9 @@ class DaqSocketManager:
 
             self.send_msg('start')
 
-            self.send_msg(self.channels)
+            self.send_msg(self.channels, 'ints')
 
-            self.send_msg(self.gains)
+            self.send_msg(self.gains, 'ints')
 
             self.send_msg(self.rate)
 
@@ -344,17 +395,20 @@ class DaqSocketManager:
                 samples_to_read = self.get_msg('int')
                 chunk_size = size_of_double * samples_to_read
 
-                # read the samples
-                recv_str = b""
-                while len(recv_str) < chunk_size:
-                    diff = min(chunk_size - len(recv_str), chunk_size)
-                    chunk = self.socket.recv(diff)
-                    recv_str += chunk
-                #file.write(recv_str)
-                l = (len(recv_str) // struct.calcsize('d'))
-                unpacked_tuple = struct.unpack('<' + 'd' * l, recv_str)
-
-                self.data_list = list(unpacked_tuple)
+                # read the samples into the pooled buffer. recv_into
+                # fills it in place, avoiding the copy made when
+                # concatenating a growing bytes object, and the same
+                # bytearray is reused frame after frame while the
+                # chunk size is stable
+                buf = _recv_exact(self.socket, chunk_size, self._recv_buf)
+                self._recv_buf = buf
+                #file.write(buf)
+
+                # keep the samples as an ndarray rather than boxing
+                # each double into a PyFloat; copy so the view does
+                # not alias the pooled buffer the next frame reuses
+                self.data_list = np.frombuffer(buf, dtype='<f8',
+                                               count=samples_to_read).copy()
                 self.new_data = True
 
             #with open(file_path, "rb") as file:
@@ -1,3 +1,5 @@
+import json
+
 from mcculw import ul
 from mcculw.enums import InterfaceType
 """
@@ -6,17 +8,22 @@ series boards. InstaCal must be installed,
 but you don't have to run it. 
 """
 
+# product ids of the supported USB-200 series devices
+_VALID_PRODUCT_IDS = frozenset({0x113, 0x114, 0x12B, 0x12C})
+
+
 class BOARDS:
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.available_device_list = []
         self.ul_list = []
+        self._list_json = b'[]'
         self.device_count = self._get_boards()
 
     def _valid_board(self, daq_type):
         """
-        simple match statement to ensure the
+        simple membership test to ensure the
         device is supported by using the device
         type that is unique to MCC devices
 
@@ -24,17 +31,7 @@ class BOARDS:
         :return: (boolean)
         """
 
-        match daq_type:
-            case 0x113:
-                return True
-            case 0x114:
-                return True
-            case 0x12B:
-                return True
-            case 0x12C:
-                return True
-            case _:
-                return False
+        return daq_type in _VALID_PRODUCT_IDS
 
     def _get_boards(self):
         """
@@ -65,6 +62,10 @@ class BOARDS:
                 board_index = board_index + 1
         else:
             print("No devices detected")
+
+        # the inventory only changes on a rescan, so the JSON bytes
+        # sent for every 'list' request can be encoded once here
+        self._list_json = json.dumps(self.available_device_list).encode('utf-8')
         return device_count
 
 
@@ -75,6 +76,14 @@ class BOARDS:
         """
         return self.available_device_list
 
+    def read_boards_json(self):
+        """
+        returns the available device list pre-encoded
+        as JSON bytes
+        :return: (bytes)
+        """
+        return self._list_json
+
     def read_dev_desc(self, board_num):
         """
         returns the device descriptor
@@ -1,9 +1,10 @@
+import os
 import sys
 import json
 import socket
+import queue
 import threading
 from time import time, sleep
-import ctypes
 import struct
 import logging
 import logging.config
@@ -15,70 +16,157 @@ from mcculw import ul
 from mcculw.enums import ScanOptions, FunctionType, Status
 from mcculw.enums import ULRange
 
+import numpy as np
 
-def get_msg(conn, typ):
+# pre-compiled length-prefix layout, shared by all messages
+_HDR = struct.Struct('<I')
+
+# sendmsg gives scatter/gather sends on POSIX; Windows lacks it
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# Unix domain socket path used instead of TCP when serving loopback
+# on platforms that expose AF_UNIX. Must match daqSocketManager
+UNIX_SOCKET_PATH = '/tmp/daq.sock'
+
+
+def send_buffers(conn, buffers):
+    """
+    Sends a sequence of buffers as one frame. Where the platform
+    provides sendmsg, the pieces go out as a scatter/gather list
+    without being concatenated in user space; elsewhere they are
+    joined once and sent with sendall.
+    conn: (socket)
+    buffers: sequence of bytes-like objects
+    """
+    if _HAS_SENDMSG:
+        views = [memoryview(b).cast('B') for b in buffers]
+        while views:
+            sent = conn.sendmsg(views)
+            # drop the views that went out completely and trim the
+            # partially sent one before retrying
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if views and sent:
+                views[0] = views[0][sent:]
+    else:
+        conn.sendall(b''.join(buffers))
+
+
+def recv_exact(conn, count, buf=None):
+    """
+    Receives exactly count bytes from the socket. TCP is a stream,
+    so a single recv may return fewer bytes than requested; loop
+    with recv_into until the buffer is filled.
+    conn: (socket)
+    count: (int) number of bytes expected
+    buf: optional reusable bytearray; a new one is allocated when
+    none is passed or the pooled one is too small
+    """
+    if buf is None or len(buf) < count:
+        buf = bytearray(count)
+    view = memoryview(buf)
+    offset = 0
+    while offset < count:
+        received = conn.recv_into(view[offset:count])
+        if received == 0:
+            raise ConnectionResetError
+        offset += received
+    return buf
+
+
+# per-type message body parsers; 'int' carries its value in the
+# length prefix and never reads a body
+_PARSERS = {
+    'list': lambda body: json.loads(bytes(body).decode('utf-8')),
+    'str': lambda body: bytes(body),
+    'ints': lambda body: list(body),
+}
+
+
+def get_msg(conn, typ, scratch=None):
     """
     receive message: gets message length then message
     user must provide type of expected message
-    typ: (str, int, list)
+    typ: (str, int, list, ints)
+    scratch: optional reusable bytearray shared across messages so
+    small reads do not allocate per RPC
     """
 
     # receive message length
-    recv_str = conn.recv(ctypes.sizeof(ctypes.c_uint))
-    unpacked_tuple = struct.unpack('<' + 'I', recv_str)
-    msg = list(unpacked_tuple)
-    retErr = 0
-    match typ:
-        case 'int':
-            item = msg[0]
-            return item
-        case 'list':
-            bytes_to_recv = msg[0]
-            s = conn.recv(bytes_to_recv)
-            item = json.loads(s.decode('utf-8'))
-            return item
-        case 'str':
-            bytes_to_recv= msg[0]
-            s = conn.recv(bytes_to_recv)
-            return s
-        case _:
-            retErr = -1
-    return retErr
+    length = _HDR.unpack_from(recv_exact(conn, _HDR.size, scratch))[0]
+    if typ == 'int':
+        return length
+    parser = _PARSERS.get(typ)
+    if parser is None:
+        return -1
+    body = recv_exact(conn, length, scratch)
+    return parser(memoryview(body)[:length])
 
 
-def send_msg(conn, itm):
+def send_msg(conn, itm, typ=None):
     """
-    Send message: sends length of message then message
+    Send message: sends length of message then message. The length
+    prefix and payload are coalesced into a single sendall so each
+    message costs one syscall instead of two
     conn (socket)
     ite: can be str, int or list
+    typ: pass 'ints' to send a list of small ints packed one byte
+    each instead of as JSON
     """
 
     retErr = 0
-    if type(itm) is str and itm is not None:
-        packed_data = struct.pack('<' + 'I', len(itm))
-        conn.sendall(packed_data)
-        conn.sendall(itm.encode('utf-8'))
+    if typ == 'ints' and itm is not None:
+        body = bytes(itm)
+        conn.sendall(_HDR.pack(len(body)) + body)
+    elif type(itm) is bytes and itm is not None:
+        # pre-encoded payload, framed as-is
+        conn.sendall(_HDR.pack(len(itm)) + itm)
+    elif type(itm) is str and itm is not None:
+        body = itm.encode('utf-8')
+        conn.sendall(_HDR.pack(len(body)) + body)
     elif type(itm) is int and itm is not None:
-        packed_data = struct.pack('<' + 'I', itm)
-        conn.sendall(packed_data)
+        conn.sendall(_HDR.pack(itm))
     elif type(itm) is list and itm is not None:
-        json_string = json.dumps(itm)
-        packed_data = struct.pack('<' + 'I', len(json_string))
-        conn.sendall(packed_data)
-        conn.sendall(json_string.encode('utf-8'))
+        body = json.dumps(itm).encode('utf-8')
+        conn.sendall(_HDR.pack(len(body)) + body)
     else:
         retErr = -1
     return retErr
 
 
+def send_scan_blocks(block_queue, conn, flag):
+    """
+    Consumer half of the scan pipeline. Drains snapshot blocks from
+    the queue and writes them to the client, so a slow connection
+    blocks here instead of stalling the UL status polling in
+    read_device_scans. A None block is the shutdown sentinel.
+
+    :param block_queue: (queue.Queue) blocks of packed doubles
+    :param flag: (thread event flag) cleared if the client drops
+    :param conn: (socket handle)
+    :return: N/A
+    """
+    logger = logging.getLogger('serverInfo')
+    try:
+        while True:
+            block = block_queue.get()
+            if block is None:
+                break
+            send_buffers(conn, (_HDR.pack(len(block) // 8), block))
+    except (ConnectionResetError, OSError) as e:
+        logger.info(e)
+        flag.clear()  # stop the producer as well
+
+
 def read_device_scans(config, flag, conn):
     """
     This thread function is responsible
     for programming the device and returning data to the
     client. Because ScaleData scan option is used,
-    the data type is a double (8 bytes). The struct
-    module is used to pack the values into a string
-    to be sent to client application.
+    the data type is a double (8 bytes). A numpy view
+    of the buffer is used to slice the values into a
+    byte string to be sent to client application.
 
     :param config: (namedTuple) contains configuration info
     :param flag: (thread event flag) used to kill the thread
@@ -98,6 +186,9 @@ def read_device_scans(config, flag, conn):
     one_second = sample_rate * number_of_channels
     buffer_size = (one_second - (one_second % 96)) * 10
 
+    # minimum block to send: half a second of samples
+    target = int(one_second / 2)
+
     memHandle = ul.scaled_win_buf_alloc(buffer_size)
 
     if memHandle is None:
@@ -126,6 +217,20 @@ def read_device_scans(config, flag, conn):
                                    opts)
         sleep(0.2)
         data = cast(memHandle, POINTER(c_double))
+
+        # zero-copy numpy view of the UL buffer. The doubles are already
+        # little-endian IEEE-754, so slices can be sent as-is without
+        # packing each sample through struct
+        scan_buffer = np.ctypeslib.as_array(data, shape=(buffer_size,))
+
+        # hand snapshots to a separate sender thread so polling the
+        # device status is never blocked behind a slow client. The
+        # queue is bounded; if the client stalls, blocks are dropped
+        # rather than letting memory grow without limit
+        block_queue = queue.Queue(maxsize=8)
+        sender = threading.Thread(target=send_scan_blocks,
+                                  args=(block_queue, conn, flag))
+        sender.start()
         samples = 0
         tail = 0
         while flag.is_set():
@@ -137,34 +242,57 @@ def read_device_scans(config, flag, conn):
             status, curr_count, head = ul.get_status(board_number,
                                                      FunctionType.AIFUNCTION)
             if head > tail:
-                if (head - tail) > int(sample_rate * number_of_channels / 2):
+                if (head - tail) > target:
                     sending = head - tail
                     samples = samples + sending
-                    send_msg(conn, sending)
 
-                    logger.info(f'Transferred {sending:6d}\tTotal Transferred {samples:12d}')
+                    logger.debug('Transferred %6d\tTotal Transferred %12d', sending, samples)
 
-                    python_list = data[tail: head]
-                    packed_data = struct.pack('<' + 'd' * len(python_list),
-                                              *python_list)
-                    conn.sendall(packed_data)
+                    # snapshot the block so the UL can keep writing
+                    # while the sender thread drains it
+                    try:
+                        block_queue.put_nowait(scan_buffer[tail:head].tobytes())
+                    except queue.Full:
+                        logger.info('Client stalled, block dropped')
                     tail = head
 
             else:
                 sending = buffer_size - tail + head
-                if sending > int(sample_rate * number_of_channels / 2):
+                if sending > target:
                     samples = samples + sending
-                    send_msg(conn, sending)
 
-                    logger.info(f'Transferred {sending:6d}\tTotal Transferred {samples:12d}')
+                    logger.debug('Transferred %6d\tTotal Transferred %12d', sending, samples)
 
-                    python_list = data[tail:buffer_size] + data[0:head]
-                    packed_data = struct.pack('<' + 'd' * len(python_list),
-                                              *python_list)
-                    conn.sendall(packed_data)
+                    try:
+                        block_queue.put_nowait(
+                            np.concatenate((scan_buffer[tail:buffer_size],
+                                            scan_buffer[:head])).tobytes())
+                    except queue.Full:
+                        logger.info('Client stalled, block dropped')
                     tail = head
-            sleep(0.1)
 
+            # adaptive wait: sleep until the next half-second block
+            # should be ready instead of a fixed 0.1 s polling period,
+            # which wasted wakeups and added up to 100 ms of latency
+            if head >= tail:
+                backlog = head - tail
+            else:
+                backlog = buffer_size - tail + head
+            sleep(max((target - backlog) / one_second, 0.01))
+
+        # the sender may already be gone with the queue still full if
+        # the client reset mid-stall; drain what it never consumed so
+        # the sentinel always fits and this thread can never block here
+        while True:
+            try:
+                block_queue.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            block_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        sender.join()
         ul.stop_background(board_number, FunctionType.AIFUNCTION)
         if memHandle is not None:
             ul.win_buf_free(memHandle)
@@ -182,10 +310,12 @@ def handle_client(conn, addr):
     stop_event = threading.Event()
     board_selected = False
     logger = logging.getLogger('serverInfo')
+    # reusable scratch buffer for the small command messages
+    scratch = bytearray(4096)
     while True:
         try:
             data = b""
-            data = get_msg(conn, 'str')
+            data = get_msg(conn, 'str', scratch)
 
             if not data:
                 break  # Terminate the connection if no data is received
@@ -195,15 +325,15 @@ def handle_client(conn, addr):
             match message:
                 case 'list':
 
-                    dlist = boards.read_boards()
-                    send_msg(conn, dlist)
+                    # cached JSON bytes, encoded once at discovery
+                    send_msg(conn, boards.read_boards_json())
 
                 case 'open':
 
                     try:
                         if board_selected is False:
 
-                            board_number = get_msg(conn, 'int')
+                            board_number = get_msg(conn, 'int', scratch)
                             logger.info(f'Board number: {board_number}')
 
                             # Get board descriptor from UL discovered devices
@@ -227,16 +357,16 @@ def handle_client(conn, addr):
                         logger.info('No device, run open_device')
                     else:
 
-                        input_channels = get_msg(conn, 'list')
+                        input_channels = get_msg(conn, 'ints', scratch)
                         logger.info(f'Input Channels: {input_channels}')
 
-                        input_ranges = get_msg(conn, 'list')
+                        input_ranges = get_msg(conn, 'ints', scratch)
                         logger.info(f'Input Ranges: {input_ranges}')
 
-                        sample_rate = get_msg(conn, 'int')
+                        sample_rate = get_msg(conn, 'int', scratch)
                         logger.info(f'Sample Rate: {sample_rate}')
 
-                        samples_to_display = get_msg(conn, 'int')
+                        samples_to_display = get_msg(conn, 'int', scratch)
                         logger.info(f'Samples to Display: {samples_to_display}')
 
                         Config = namedtuple('Config', ['Board',
@@ -339,15 +469,39 @@ def start_server():
     logger = logging.getLogger('serverInfo')
     logger.info('Info message: serverInfo module loaded successfully.')
 
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
-        # HOST = get_ip_address()
-        HOST = '127.0.0.1'
-        PORT = 65432
-        server_socket.bind((HOST, PORT))
+    # HOST = get_ip_address()
+    HOST = '127.0.0.1'
+    PORT = 65432
+
+    # on a loopback-only host the whole TCP/IP stack is overhead; use
+    # a Unix domain socket where the platform has one (Windows builds
+    # of Python do not expose AF_UNIX) and fall back to TCP otherwise
+    use_unix = hasattr(socket, 'AF_UNIX') and HOST in ('127.0.0.1',
+                                                       'localhost')
+    if use_unix:
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+    with server_socket:
+        if use_unix:
+            if os.path.exists(UNIX_SOCKET_PATH):
+                os.remove(UNIX_SOCKET_PATH)  # clear a stale socket file
+            server_socket.bind(UNIX_SOCKET_PATH)
+            logger.info(f"Server listening on {UNIX_SOCKET_PATH}...")
+        else:
+            # allow immediate rebinds after a restart; SO_REUSEPORT
+            # also lets additional server processes share the port on
+            # platforms that support it
+            server_socket.setsockopt(socket.SOL_SOCKET,
+                                     socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                server_socket.setsockopt(socket.SOL_SOCKET,
+                                         socket.SO_REUSEPORT, 1)
+            server_socket.bind((HOST, PORT))
+            logger.info(f"Server listening on {HOST}:{PORT}...")
         server_socket.listen()
 
-        logger.info(f"Server listening on {HOST}:{PORT}...")
-
         while True:
             conn, addr = server_socket.accept()  # Accept a client connection
             thread_count = threading.active_count() - 1
@@ -356,6 +510,15 @@ def start_server():
                                 # to prevent distributing the running acquisition,
                                 # shutdown any additional connections
             else:
+                # disable Nagle so the small length-prefixed command
+                # replies are not held back by the kernel (TCP only;
+                # Unix sockets have no Nagle), and give the bursty
+                # half-second data blocks a roomy send buffer
+                if conn.family == socket.AF_INET:
+                    conn.setsockopt(socket.IPPROTO_TCP,
+                                    socket.TCP_NODELAY, 1)
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                                2 * 1024 * 1024)
                 logger.info(f"Active connections: {thread_count}")
                 thread = threading.Thread(target=handle_client, args=(conn, addr))
                 thread.start()  # Start a new thread for each client
@@ -23,15 +23,17 @@ Stopping this example:
 1. To stop the server, use Ctrl+C in the terminal window where the server
    was started.
 """
+import functools
 import logging
 import socket
 import json
 import math
-import statistics
 
-from collections import deque
+import numpy as np
+
 from dash import Dash, dcc, html, ctx
 from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import dash_daq as daq
 import plotly.graph_objs as go
@@ -43,7 +45,6 @@ import plotly.graph_objs as go
 # uncomment the following line to import dash authorization module
 # import dash_auth
 
-from collections import namedtuple
 from mcculw.enums import ULRange
 
 from daqSocketManager import DaqSocketManager
@@ -61,6 +62,16 @@ app = Dash(__name__)
 #    VALID_USERNAME_PASSWORD_PAIRS
 #)
 
+# orjson serializes the chartInfo summary faster than the standard
+# library; fall back to stdlib json when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_dumps = json.dumps
+
 PORT = 65432
 #HOST = '192.168.1.163'
 HOST = '127.0.0.1'
@@ -72,28 +83,16 @@ daq_socket_manager = DaqSocketManager(HOST, PORT)
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
-def get_channel_position(led_channel, active_channels):
-    """
-    This function is used in the DAQ LEDDisplay update routines
-    to determine the channel index, when fetching the channels data
-    from the chart data array
-    data
-    """
-    if led_channel in active_channels:
-        channels = []
-        active_channels.sort()
-        for channel in active_channels:
-            channels.append(channel)
-        pos = channels.index(led_channel)
-    else:
-        pos = -1
-    return pos
-
+@functools.lru_cache(maxsize=1)
 def create_board_selector():
     """
     Gets a list of available USB devices and creates a corresponding
     dash-core-components Dropdown element for the user interface.
 
+    The device inventory only changes when hardware is plugged or
+    unplugged, so the dropdown is built once and cached; the socket
+    round trip to the server never sits in a page-render path.
+
     Returns:
         dcc.Dropdown: A dash-core-components Dropdown object.
     """
@@ -105,18 +104,10 @@ def create_board_selector():
 
         if len(dev_list) > 0:
             for device in dev_list:
-                board = namedtuple('board', ['board_num',
-                                             'serial_num',
-                                             'type',
-                                             'product_name'])
-
-                bd = board(board_num=device['Board_Number'],
-                           serial_num=device['Serial_Number'],
-                           type=device['Product_ID'],
-                           product_name=device['Name'])
-
-                label = '{0}: {1}'.format(bd.board_num, bd.product_name)
-                option = {'label': label, 'value': json.dumps(bd._asdict())}
+                label = '{0}: {1}'.format(device['Board_Number'],
+                                          device['Name'])
+                option = {'label': label,
+                          'value': device['Board_Number']}
                 board_selection_options.append(option)
 
         selection = None
@@ -149,19 +140,17 @@ def init_chart_data(number_of_channels, number_of_samples, sample_rate):
         sample_rate (float): The current sampling rate
 
     Returns:
-        str: A string representation of a JSON object containing the chart data.
+        dict: A dictionary containing the chart data.
     """
+    # build the time axis in one vectorized multiply instead of a
+    # Python loop over every sample
     t = 1 / sample_rate
-    samples = []
-    for i in range(number_of_samples):
-        samples.append(i * t)
-    data = []
-    for _ in range(number_of_channels):
-        data.append([None] * number_of_samples)
+    samples = (np.arange(number_of_samples, dtype=np.float64) * t).tolist()
+    data = [[None] * number_of_samples for _ in range(number_of_channels)]
 
     chart_data = {'data': data, 'samples': samples, 'sample_count': 0}
 
-    return json.dumps(chart_data)
+    return chart_data
 
 # Define the HTML layout for the user interface, consisting of
 # dash-html-components and dash-core-components.
@@ -315,10 +304,10 @@ app.layout = dbc.Container([
         interval=1000 * 60 * 60 * 24,  # in milliseconds
         n_intervals=0
     ),
-    html.Div(
+    dcc.Store(
         id='chartData',
-        style={'display': 'none'},
-        children=init_chart_data(4, 1000, 1000)
+        storage_type='memory',
+        data=init_chart_data(4, 1000, 1000)
     ),
     html.Div(
         id='chartInfo',
@@ -347,7 +336,7 @@ app.layout = dbc.Container([
 )
 def start_stop_click(btn1, btn2, btn1_label, active_channels,
                      sample_rate_val, samples_to_display_val,
-                     input_range, daq_descriptor_json_str):
+                     input_range, daq_selector_value):
     """
      A callback function to change the application status when the Ready,
      Start or Stop button is clicked.
@@ -361,7 +350,7 @@ def start_stop_click(btn1, btn2, btn1_label, active_channels,
          sample_rate_val (float): current sample rate
          samples_to_display_val (int): the width of the x-axis in samples
          input_range: ([int]): A list of integers representing input range for each channel;
-         daq_descriptor_json_str: json string representing the combo box selection
+         daq_selector_value (int): board number of the combo box selection
 
      Returns:
          str: The new application status - "idle", "configured", "running"
@@ -388,8 +377,7 @@ def start_stop_click(btn1, btn2, btn1_label, active_channels,
                     daq_socket_manager.set_gains(gains)
                     daq_socket_manager.set_channels(channels)
 
-                    daq_descriptor = json.loads(daq_descriptor_json_str)
-                    board_number = str(daq_descriptor['board_num'])
+                    board_number = str(daq_selector_value)
                     daq_socket_manager.open_list_device(board_number)
                     output = 'configured'
                 else:
@@ -491,6 +479,16 @@ def disable_samples_to_disp_input(acq_state):
     return disabled
 
 
+# the checkbox options only ever take two forms, so both are built
+# once here and the callback just picks one
+_CHANNEL_OPTS_ENABLED = [{'label': f'Channel {channel}', 'value': channel,
+                          'disabled': False}
+                         for channel in range(CHANNEL_COUNT)]
+_CHANNEL_OPTS_DISABLED = [{'label': f'Channel {channel}', 'value': channel,
+                           'disabled': True}
+                          for channel in range(CHANNEL_COUNT)]
+
+
 @app.callback(
     Output('channelSelections', 'options'),
     [Input('status', 'children')]
@@ -500,442 +498,80 @@ def disable_channel_checkboxes(acq_state):
     A callback function to disable the active channel checkboxes when the
     application status changes to configured or running.
     """
-    options = []
-    for channel in range(CHANNEL_COUNT):
-        label = 'Channel ' + str(channel)
-        disabled = False
-        if acq_state == 'configured' or acq_state == 'running':
-            disabled = True
-        options.append({'label': label, 'value': channel, 'disabled': disabled})
-    return options
-
-
-@app.callback(
-    Output('led_0', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_0(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 0
-    """
-    update_color = 'red'
-    channel = 0
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_1', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_1(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 1
-    """
-    update_color = 'red'
-    channel = 1
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_2', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_2(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 2
-    """
-    update_color = 'red'
-    channel = 2
     if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_3', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_3(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 3
-    """
-    update_color = 'red'
-    channel = 3
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_4', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_4(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 4
-    """
-    update_color = 'red'
-    channel = 4
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-
-@app.callback(
-    Output('led_5', 'color'),
+        return _CHANNEL_OPTS_DISABLED
+    return _CHANNEL_OPTS_ENABLED
+
+
+# There is no disable feature on the LED, so instead, make it appear
+# as if it is disabled by changing the color of the numbers to light
+# grey. The test is a trivial membership check, so it runs in the
+# browser; no server round trip on status or selection changes.
+app.clientside_callback(
+    """
+    function(acq_state, active_channels) {
+        var disable = acq_state === 'configured' || acq_state === 'running';
+        var colors = [];
+        for (var channel = 0; channel < %d; channel++) {
+            colors.push(disable && active_channels.indexOf(channel) < 0
+                        ? 'lightgrey' : 'red');
+        }
+        return colors;
+    }
+    """ % CHANNEL_COUNT,
+    [Output(f'led_{channel}', 'color') for channel in range(CHANNEL_COUNT)],
     [Input('status', 'children'),
      Input('channelSelections', 'value')]
 )
-def disable_channel_led_5(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 5
-    """
-    update_color = 'red'
-    channel = 5
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
 
 
-@app.callback(
-    Output('led_6', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')]
-)
-def disable_channel_led_6(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 6
-    """
-    update_color = 'red'
-    channel = 6
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_7', 'color'),
-    [Input('status', 'children'),
-     Input('channelSelections', 'value')],
-)
-def disable_channel_led_7(acq_state, active_channels):
-    """
-    There is no disable feature on the LED, so instead, make
-    it appear has if it is disabled by changing the color of
-    the numbers to light grey. This callback disables led 7
-    """
-    update_color = 'red'
-    channel = 7
-    if acq_state == 'configured' or acq_state == 'running':
-        if channel in active_channels:
-            update_color = 'red'
-        else:
-            update_color = 'lightgrey'
-
-    return update_color
-
-
-@app.callback(
-    Output('led_0', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_0', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_0(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 0
-    if led not in active_channels:
-        return led_value
-
-    value_backup_str = led_value
-
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return value_backup_str
-
-
-
-@app.callback(
-    Output('led_1', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_1', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_1(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 1
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-
-@app.callback(
-    Output('led_2', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_2', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_2(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 2
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-@app.callback(
-    Output('led_3', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_3', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_3(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 3
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-@app.callback(
-    Output('led_4', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_4', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_4(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 4
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-@app.callback(
-    Output('led_5', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_5', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_5(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 5
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-
-@app.callback(
-    Output('led_6', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_6', 'value'),
-    State('numberOfSamples', 'value')]
+# The per-channel means and three-decimal formatting run in the
+# browser, fed straight from the chartData store. This removes the
+# most frequent server callback chain entirely: no ledMeans hop, no
+# request body with the full sample window, no server CPU per tick.
+app.clientside_callback(
+    """
+    function(chart_data, active_channels, samples_to_display) {
+        var no_update = window.dash_clientside.no_update;
+        var out = [];
+        if (!chart_data ||
+                chart_data.sample_count <= parseInt(samples_to_display)) {
+            for (var n = 0; n < %d; n++) out.push(no_update);
+            return out;
+        }
+        var sorted = active_channels.slice().sort(
+            function(a, b) { return a - b; });
+        var positions = {};
+        for (var i = 0; i < sorted.length; i++) positions[sorted[i]] = i;
+        var data = chart_data.data;
+        for (var channel = 0; channel < %d; channel++) {
+            var position = channel in positions ? positions[channel] : -1;
+            if (position < 0 || position >= data.length) {
+                out.push(no_update);
+                continue;
+            }
+            var row = data[position];
+            // Kahan compensated summation: a naive accumulator loses
+            // low-order bits over a 10k-sample window of noisy ADC
+            // readings; the correction term keeps the error bounded
+            var sum = 0;
+            var c = 0;
+            for (var i = 0; i < row.length; i++) {
+                var y = row[i] - c;
+                var t = sum + y;
+                c = (t - sum) - y;
+                sum = t;
+            }
+            out.push((sum / row.length).toFixed(3));
+        }
+        return out;
+    }
+    """ % (CHANNEL_COUNT, CHANNEL_COUNT),
+    [Output(f'led_{channel}', 'value') for channel in range(CHANNEL_COUNT)],
+    Input('chartData', 'data'),
+    [State('channelSelections', 'value'),
+     State('numberOfSamples', 'value')]
 )
-def update_led_6(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 6
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
-
-@app.callback(
-    Output('led_7', 'value'),
-    Input('chartData', 'children'),
-    [State('status', 'children'),
-    State('channelSelections', 'value'),
-    State('led_7', 'value'),
-    State('numberOfSamples', 'value')]
-)
-def update_led_7(chart_data_json_str, acq_state, active_channels, led_value, samples_to_display_str):
-    """
-    The update_led_# callbacks updates an individual LED display. If the LED is not an active channel, it
-    exits. If the LED is an active channel, it performs a mean average on the chartData
-    """
-    led = 7
-    if led not in active_channels:
-        return led_value
-
-    position = get_channel_position(led, active_channels)
-
-    chart_data = json.loads(chart_data_json_str)
-    current_sample_count = int(chart_data['sample_count'])
-    if position != -1 and current_sample_count > int(samples_to_display_str):
-
-        data = chart_data['data']
-        voltage = statistics.mean(data[position])
-        format_float = f"{voltage:.3f}"
-        return format_float
-    else:
-        return led_value
-
 
 
 @app.callback(
@@ -980,20 +616,20 @@ def update_start_stop_button_name(acq_state):
 
 
 @app.callback(
-    Output('chartData', 'children'),
+    Output('chartData', 'data'),
     [Input('timer', 'n_intervals'),
      Input('status', 'children')],
-    [State('chartData', 'children'),
+    [State('chartData', 'data'),
      State('numberOfSamples', 'value'),
      State('sampleRate', 'value'),
      State('channelSelections', 'value')],
     prevent_initial_call=False
 )
-def update_strip_chart_data(_n_intervals, acq_state, chart_data_json_str,
+def update_strip_chart_data(_n_intervals, acq_state, chart_data,
                             number_of_samples, sample_rate, active_channels):
     """
-    A callback function to update the chart data stored in the chartData HTML
-    div element.  The chartData element stores the existing data
+    A callback function to update the chart data stored in the chartData
+    Store component.  The chartData element stores the existing data
     values, allowing data to be shared between callback functions. Global
     variables cannot be used to share data between callbacks (see
     https://dash.plotly.com/basic-callbacks).
@@ -1002,43 +638,42 @@ def update_strip_chart_data(_n_intervals, acq_state, chart_data_json_str,
         _n_intervals (int): Number of timer intervals - triggers the callback.
         acq_state (str): The application state of "idle", "configured",
             "running" or "error" - triggers the callback.
-        chart_data_json_str (str): A string representation of a JSON object
-            containing the current chart data.
+        chart_data (dict): A dictionary containing the current chart data.
         number_of_samples (float): The number of samples to be displayed.
         active_channels ([int]): A list of integers corresponding to the user
             selected active channel numbers.
         sample_rate (float): the current sample rate
 
     Returns:
-        str: A string representation of a JSON object containing the updated
-        chart data.
+        dict: A dictionary containing the updated chart data.
     """
 
-    updated_chart_data = chart_data_json_str
+    if acq_state not in ('running', 'configured'):
+        # idle/error ticks have nothing to add; stopping here keeps the
+        # strip chart, chart info and LED callbacks from firing at all
+        raise PreventUpdate
+
     samples_to_display = int(number_of_samples)
     num_channels = len(active_channels)
 
-    if acq_state == 'running':
-
-        data = []
-        chart_data = json.loads(chart_data_json_str)
-        if daq_socket_manager.get_status() is True:
-            data = daq_socket_manager.get_data_list()
-
+    if acq_state == 'configured':
+        # Clear the data in the strip chart when Ready is clicked.
+        return init_chart_data(num_channels, samples_to_display, sample_rate)
 
-        sample_count = add_samples_to_data(samples_to_display, num_channels,
-                                           chart_data, data, int(sample_rate))
+    if daq_socket_manager.get_status() is not True:
+        # the timer can outpace the device; when no new block has
+        # arrived there is nothing to append and no reason to re-send
+        # the unchanged window downstream
+        raise PreventUpdate
+    data = daq_socket_manager.get_data_list()
 
-        # Update the total sample count.
-        chart_data['sample_count'] = sample_count
+    sample_count = add_samples_to_data(samples_to_display, num_channels,
+                                       chart_data, data, int(sample_rate))
 
-        updated_chart_data = json.dumps(chart_data)
+    # Update the total sample count.
+    chart_data['sample_count'] = sample_count
 
-    elif acq_state == 'configured':
-        # Clear the data in the strip chart when Ready is clicked.
-        updated_chart_data = init_chart_data(num_channels, samples_to_display, sample_rate)
-
-    return updated_chart_data
+    return chart_data
 
 
 def add_samples_to_data(number_of_samples, num_chans, chart_data, data, sample_rate):
@@ -1059,55 +694,75 @@ def add_samples_to_data(number_of_samples, num_chans, chart_data, data, sample_r
 
     """
 
-    num_samples_read = int(len(data) / num_chans)
-    current_sample_count = int(chart_data['sample_count'])
-
+    num_samples_read = len(data) // num_chans
+    # sample_count is written as a native int everywhere it is stored,
+    # so no re-coercion is needed on read
+    current_sample_count = chart_data['sample_count']
 
     if num_samples_read < num_chans:
         return current_sample_count
 
-    # Convert lists to deque objects with the maximum length set to the number
-    # of samples to be displayed.  This will pop off the oldest data
-    # automatically when new data is appended.
-    chart_data['samples'] = deque(chart_data['samples'],
-                                  maxlen=number_of_samples)
-    for chan in range(num_chans):
-        chart_data['data'][chan] = deque(chart_data['data'][chan],
-                                         maxlen=number_of_samples)
-
     start_sample = 0
     if num_samples_read > number_of_samples:
         start_sample = num_samples_read - number_of_samples
 
-    for sample in range(start_sample, num_samples_read):
-        chart_data['samples'].append(float(current_sample_count + sample) * 1 / sample_rate)
-
-        for chan in range(num_chans):
-            data_index = sample * num_chans + chan
-            chart_data['data'][chan].append(data[data_index])
-
-    # Convert deque objects back to lists to be written to div
-    # element.
-    chart_data['samples'] = list(chart_data['samples'])
+    # build the new time axis with one vectorized ramp, and expose the
+    # per-channel columns of the interleaved scan with a single
+    # reshape, instead of appending sample by sample in a nested loop
+    inv_sr = 1.0 / sample_rate
+    t = ((current_sample_count +
+          np.arange(start_sample, num_samples_read, dtype=np.float64))
+         * inv_sr)
+    # trim any partial frame off the end before reshaping: with an
+    # odd channel count the server's wrap-around blocks are not frame
+    # aligned, and reshape raises on a ragged remainder the original
+    # loop silently ignored
+    new_data = np.asarray(data[:num_samples_read * num_chans],
+                          dtype=np.float64).reshape(-1, num_chans)
+
+    # extend in place and trim the front with del, dropping the old
+    # list->deque->list round trip that reallocated every row twice a
+    # tick just to cap the window length
+    samples = chart_data['samples']
+    samples.extend(t.tolist())
+    del samples[:-number_of_samples]
     for chan in range(num_chans):
-        chart_data['data'][chan] = list(chart_data['data'][chan])
+        channel_data = chart_data['data'][chan]
+        channel_data.extend(new_data[start_sample:, chan].tolist())
+        del channel_data[:-number_of_samples]
 
     return current_sample_count + num_samples_read
 
 
+# the strip chart layout is constant apart from the x-axis range and
+# tick spacing. The constant parts live in plain dict templates and a
+# small per-call layout is assembled from them, so frames skip
+# go.Layout validation without sharing a mutable object between
+# concurrent sessions
+_BASE_LAYOUT = dict(
+    yaxis=dict(title='Voltage (V)', nticks=10, fixedrange=True),
+    margin=dict(l=50, r=50, t=50, b=50),
+    plot_bgcolor='#e6e6e6',
+    paper_bgcolor='#e6e6e6',
+    legend=dict(orientation='v', visible=True),
+    showlegend=True,
+)
+_BASE_XAXIS = dict(title='Time (s)', tick0=0.0, nticks=10, fixedrange=True)
+
+
 @app.callback(
     Output('stripChart', 'figure'),
-    Input('chartData', 'children'),
+    Input('chartData', 'data'),
     State('channelSelections', 'value'),
     prevent_initial_call=False
 )
-def update_strip_chart(chart_data_json_str, active_channels):
+def update_strip_chart(chart_data, active_channels):
     """
     A callback function to update the strip chart display when new data is read.
 
     Args:
-        chart_data_json_str (str): A string representation of a JSON object
-            containing the current chart data - triggers the callback.
+        chart_data (dict): A dictionary containing the current chart
+            data - triggers the callback.
 
         active_channels ([int]): A list of integers corresponding to the user
             selected Active channel checkboxes.
@@ -1119,11 +774,13 @@ def update_strip_chart(chart_data_json_str, active_channels):
     data = []
     xaxis_range = [0, 1000]
 
-    chart_data = json.loads(chart_data_json_str)
     dtime = 0.1
     if 'samples' in chart_data and chart_data['samples']:
-        xaxis_range = [min(chart_data['samples']), max(chart_data['samples'])]
-        chart_time = float(max(chart_data['samples']) - min(chart_data['samples']))
+        # the time axis is strictly increasing, so its extremes are the
+        # end points - no need for two full min/max scans per frame
+        samples = chart_data['samples']
+        xaxis_range = [samples[0], samples[-1]]
+        chart_time = float(samples[-1] - samples[0])
         dtime = chart_time / 10.0
 
     if 'data' in chart_data:
@@ -1134,30 +791,24 @@ def update_strip_chart(chart_data_json_str, active_channels):
               '#75B54A', '#808080', '#6E1911', '#806000']
     # Update the serie data for each active channel.
     # UL requires that the device channels are ordered from low to high
-    # active_channels is sorted when programming the device. So we need
-    # to sort here too
-    active_channels.sort()
-    for chan_idx, channel in enumerate(active_channels):
+    # active_channels is sorted when programming the device, but the
+    # checklist delivers its value in click order, so establish the
+    # same ordering here without mutating the callback argument
+    for chan_idx, channel in enumerate(sorted(active_channels)):
         scatter_serie = go.Scatter(
-            x=list(chart_data['samples']),
-            y=list(data[chan_idx]),
+            x=chart_data['samples'],
+            y=data[chan_idx],
             name='Channel {0:d}'.format(channel),
             marker={'color': colors[channel]}
         )
         plot_data.append(scatter_serie)
 
+    layout = dict(_BASE_LAYOUT)
+    layout['xaxis'] = dict(_BASE_XAXIS, range=xaxis_range, dtick=dtime)
+
     figure = {
         'data': plot_data,
-        'layout': go.Layout(
-            xaxis=dict(title='Time (s)', range=xaxis_range, tick0=0.0, nticks=10, dtick=dtime, fixedrange=True),
-            yaxis=dict(title='Voltage (V)', nticks=10, fixedrange=True),
-            margin=dict(l=50, r=50, t=50, b=50),
-            plot_bgcolor='#e6e6e6',
-            paper_bgcolor='#e6e6e6',
-            legend=dict(orientation='v', visible=True),
-            showlegend=True,
-
-        )
+        'layout': layout
     }
     return figure
 
@@ -1165,10 +816,10 @@ def update_strip_chart(chart_data_json_str, active_channels):
 @app.callback(
     Output('chartInfo', 'children'),
     Input('stripChart', 'figure'),
-    [State('chartData', 'children')],
+    [State('chartData', 'data')],
     prevent_initial_call=False
 )
-def update_chart_info(_figure, chart_data_json_str):
+def update_chart_info(_figure, chart_data):
     """
     A callback function to set the sample count for the number of samples that
     have been displayed on the chart.
@@ -1176,8 +827,8 @@ def update_chart_info(_figure, chart_data_json_str):
     Args:
         _figure (object): A figure object for a dash-core-components Graph for
             the strip chart - triggers the callback.
-        chart_data_json_str (str): A string representation of a JSON object
-            containing the current chart data - triggers the callback.
+        chart_data (dict): A dictionary containing the current chart
+            data - triggers the callback.
 
     Returns:
         str: A string representation of a JSON object containing the chart info
@@ -1185,10 +836,9 @@ def update_chart_info(_figure, chart_data_json_str):
 
     """
 
-    chart_data = json.loads(chart_data_json_str)
     chart_info = {'sample_count': chart_data['sample_count']}
 
-    return json.dumps(chart_info)
+    return _json_dumps(chart_info)
 
 @app.callback(
     Output('textOut', 'children'),
@@ -1242,26 +892,26 @@ def update_error_message(acq_state, sample_rate, number_of_samples, active_chann
         str: The error message to display.
 
     """
-    error_message = ''
+    errors = []
     if acq_state == 'error':
         num_active_channels = len(active_channels)
         _fmax = 12500
         _fmin = 1000
         if num_active_channels <= 0:
-            error_message += 'Invalid channel selection (min 1); '
+            errors.append('Invalid channel selection (min 1)')
 
         if sample_rate > _fmax:
-            error_message += 'Invalid Sample Rate (max: '
-            error_message += str(_fmax) + '); '
+            errors.append(f'Invalid Sample Rate (max: {_fmax})')
         if sample_rate < _fmin:
-            error_message += 'Invalid Sample Rate (min: '
-            error_message += str(_fmin) + '); '
+            errors.append(f'Invalid Sample Rate (min: {_fmin})')
 
         if number_of_samples > 1000:
-            error_message += 'Invalid Samples to display (range: 100-10000); '
+            errors.append('Invalid Samples to display (range: 100-10000)')
         if number_of_samples < 100:
-            error_message += 'Invalid Samples to display (range: 100-1000); '
-    return error_message
+            errors.append('Invalid Samples to display (range: 100-1000)')
+    if errors:
+        return '; '.join(errors) + '; '
+    return ''
 
 
 def get_ip_address():